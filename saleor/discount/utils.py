@@ -65,7 +65,12 @@ def get_product_discount_on_sale(
 
 def get_product_discounts(product: "Product", discounts: "DiscountsListType") -> Money:
     """Return discount values for all discounts applicable to a product."""
-    product_collections = set(product.collections.all().values_list("pk", flat=True))
+    # Reuse collections prefetched on the product, as `values_list` would bypass
+    # the prefetch cache; otherwise fetch only their ids.
+    if "collections" in getattr(product, "_prefetched_objects_cache", {}):
+        product_collections = {c.pk for c in product.collections.all()}
+    else:
+        product_collections = set(product.collections.values_list("pk", flat=True))
     for discount in discounts or []:
         try:
             yield get_product_discount_on_sale(product, product_collections, discount)
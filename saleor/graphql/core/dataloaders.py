@@ -0,0 +1,68 @@
+from collections import defaultdict
+from typing import DefaultDict, Iterable, List, Optional, TypeVar
+
+from promise import Promise
+from promise.dataloader import DataLoader as BaseLoader
+
+K = TypeVar("K")
+R = TypeVar("R")
+
+
+class DataLoader(BaseLoader):
+    """Base class for data loaders shared across a single request.
+
+    Loader instances are stored on the request object under `context_key`, so
+    every resolver asking for the same loader within one request gets the same
+    instance and all keys loaded before the batch is dispatched end up in one
+    database query.
+    """
+
+    context_key: Optional[str] = None
+    context = None
+
+    def __new__(cls, context):
+        key = cls.context_key
+        if key is None:
+            raise TypeError("Data loader %r does not define a context key" % (cls,))
+        if not hasattr(context, "dataloaders"):
+            context.dataloaders = {}
+        if key not in context.dataloaders:
+            context.dataloaders[key] = super().__new__(cls)
+        loader = context.dataloaders[key]
+        assert isinstance(loader, cls)
+        return loader
+
+    def __init__(self, context):
+        if self.context != context:
+            self.context = context
+            super().__init__()
+
+    def batch_load_fn(self, keys):
+        results = self.batch_load(keys)
+        if not isinstance(results, Promise):
+            return Promise.resolve(results)
+        return results
+
+    def batch_load(self, keys: Iterable[K]) -> List[R]:
+        raise NotImplementedError()
+
+
+def get_operation_cache(context, key: str) -> dict:
+    """Return a dict for caching data under `key` while executing an operation.
+
+    Caches are kept along with the data loaders in `context.dataloaders`, so they
+    are dropped together with them once the operation or a mutation is done.
+    """
+    if not hasattr(context, "dataloaders"):
+        context.dataloaders = {}
+    return context.dataloaders.setdefault(key, {})
+
+
+def group_by_key(
+    keys: Iterable[K], items: Iterable[R], key_field: str
+) -> List[List[R]]:
+    """Group items by the value of `key_field` in the order of given keys."""
+    grouped: DefaultDict[K, List[R]] = defaultdict(list)
+    for item in items:
+        grouped[getattr(item, key_field)].append(item)
+    return [grouped.get(key, []) for key in keys]
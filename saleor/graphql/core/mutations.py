@@ -277,6 +277,9 @@ class BaseMutation(graphene.Mutation):
 
         try:
             response = cls.perform_mutation(root, info, **data)
+            # Data loaders cache results for the whole operation, drop them so
+            # the mutation payload and the following fields see the changes
+            info.context.dataloaders = {}
             if response.errors is None:
                 response.errors = []
             return response
@@ -561,6 +564,7 @@ class BaseBulkMutation(BaseMutation):
             raise PermissionDenied()
 
         count, errors = cls.perform_mutation(root, info, **data)
+        info.context.dataloaders = {}
         if errors:
             return cls.handle_errors(errors, count=count)
 
@@ -1,5 +1,5 @@
 import binascii
-from typing import Union
+from typing import Tuple, Union
 
 import graphene
 import graphene_django_optimizer as gql_optimizer
@@ -36,6 +36,16 @@ def validate_image_file(file, field_name):
         )
 
 
+def decode_global_id(global_id: str) -> Tuple[str, str]:
+    """Split a node global id into its type name and id.
+
+    Equivalent of `graphql_relay.from_global_id` calling `binascii` directly,
+    used in paths decoding many ids per request.
+    """
+    _type, _id = binascii.a2b_base64(global_id).split(b":", 1)
+    return _type.decode("utf-8"), _id.decode("utf-8")
+
+
 def from_global_id_strict_type(
     global_id: str, only_type: Union[ObjectType, str], field: str = "id"
 ) -> str:
@@ -0,0 +1,28 @@
+from ...product.models import AttributeValue, Category, ProductImage
+from ..core.dataloaders import DataLoader, group_by_key
+
+
+class ImagesByProductIdLoader(DataLoader):
+    context_key = "images_by_product"
+
+    def batch_load(self, keys):
+        images = ProductImage.objects.filter(product_id__in=keys)
+        return group_by_key(keys, images, "product_id")
+
+
+class AttributeValuesByAttributeIdLoader(DataLoader):
+    context_key = "attributevalues_by_attribute"
+
+    def batch_load(self, keys):
+        values = AttributeValue.objects.filter(attribute_id__in=keys).select_related(
+            "attribute"
+        )
+        return group_by_key(keys, values, "attribute_id")
+
+
+class ChildrenByCategoryIdLoader(DataLoader):
+    context_key = "children_by_category"
+
+    def batch_load(self, keys):
+        categories = Category.objects.filter(parent_id__in=keys).only("id", "parent_id")
+        return group_by_key(keys, categories, "parent_id")
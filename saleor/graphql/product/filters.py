@@ -2,7 +2,7 @@ from collections import defaultdict
 from typing import Dict, List, Optional
 
 import django_filters
-from django.db.models import Q, Subquery, Sum
+from django.db.models import Subquery, Sum
 from graphene_django.filter import GlobalIDFilter, GlobalIDMultipleChoiceFilter
 
 from ...product.filters import filter_products_by_attributes_values
@@ -202,13 +202,20 @@ def filter_attributes_by_product_types(qs, field, value):
         category_id = from_global_id_strict_type(
             value, only_type="Category", field=field
         )
-        category = Category.objects.filter(pk=category_id).first()
+        tree_data = (
+            Category.objects.filter(pk=category_id)
+            .values_list("tree_id", "lft", "rght")
+            .first()
+        )
 
-        if category is None:
+        if tree_data is None:
             return qs.none()
 
-        tree = category.get_descendants(include_self=True)
-        product_qs = Product.objects.filter(category__in=tree)
+        # Match the category and all its descendants by their MPTT range
+        tree_id, lft, rght = tree_data
+        product_qs = Product.objects.filter(
+            category__tree_id=tree_id, category__lft__gte=lft, category__rght__lte=rght,
+        )
 
     elif field == "in_collection":
         collection_id = from_global_id_strict_type(
@@ -219,10 +226,19 @@ def filter_attributes_by_product_types(qs, field, value):
     else:
         raise NotImplementedError(f"Filtering by {field} is unsupported")
 
-    product_types = set(product_qs.values_list("product_type_id", flat=True))
-    return qs.filter(
-        Q(product_types__in=product_types) | Q(product_variant_types__in=product_types)
+    # Union of the two lookups removes duplicates before they reach the outer
+    # query, instead of deduplicating an OR-ed join of both M2M relations
+    product_types = product_qs.values_list("product_type_id", flat=True).distinct()
+    product_attributes = Attribute.objects.filter(product_types__in=product_types)
+    variant_attributes = Attribute.objects.filter(
+        product_variant_types__in=product_types
+    )
+    attribute_ids = (
+        product_attributes.values("id")
+        .order_by()
+        .union(variant_attributes.values("id").order_by())
     )
+    return qs.filter(id__in=attribute_ids)
 
 
 class ProductFilter(django_filters.FilterSet):
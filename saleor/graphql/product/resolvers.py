@@ -3,12 +3,12 @@ from typing import TYPE_CHECKING
 import graphene_django_optimizer as gql_optimizer
 from django.db.models import Sum
 from graphql import GraphQLError
-from graphql_relay import from_global_id
 
 from ...order import OrderStatus
 from ...product import models
 from ...search.backends import picker
 from ..core.enums import OrderDirection
+from ..core.utils import decode_global_id
 from ..utils import (
     filter_by_period,
     filter_by_query_param,
@@ -73,7 +73,7 @@ def resolve_attributes(
 
 
 def resolve_categories(info, query, level=None, sort_by=None, **_kwargs):
-    qs = models.Category.objects.prefetch_related("children")
+    qs = models.Category.objects.all()
     if level is not None:
         qs = qs.filter(level=level)
     qs = filter_by_query_param(qs, query, CATEGORY_SEARCH_FIELDS)
@@ -120,7 +120,7 @@ def sort_products_by_attribute(
 
     # If an attribute ID was passed, attempt to convert it
     if sort_by.attribute_id:
-        graphene_type, attribute_pk = from_global_id(sort_by.attribute_id)
+        graphene_type, attribute_pk = decode_global_id(sort_by.attribute_id)
         is_ascending = direction == OrderDirection.ASC
 
         # If the passed attribute ID is valid, execute the sorting
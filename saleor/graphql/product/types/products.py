@@ -1,5 +1,4 @@
-from dataclasses import asdict
-from typing import List, Union
+from typing import List, Tuple, Union
 
 import graphene
 import graphene_django_optimizer as gql_optimizer
@@ -20,7 +19,6 @@ from ....product.utils.availability import (
     get_variant_availability,
 )
 from ....product.utils.costs import get_margin_for_variant, get_product_costs_data
-from ....warehouse import models as stock_models
 from ....warehouse.availability import (
     get_available_quantity,
     get_available_quantity_for_customer,
@@ -29,6 +27,7 @@ from ....warehouse.availability import (
     is_variant_in_stock,
 )
 from ...core.connection import CountableDjangoObjectType
+from ...core.dataloaders import get_operation_cache
 from ...core.enums import ReportingPeriod, TaxRateType
 from ...core.fields import FilterInputConnectionField, PrefetchingConnectionField
 from ...core.resolvers import resolve_meta, resolve_private_meta
@@ -50,13 +49,30 @@ from ...translations.types import (
     ProductVariantTranslation,
 )
 from ...utils import get_database_id, reporting_period_to_date
+from ...warehouse.dataloaders import StockByProductVariantIdLoader
 from ...warehouse.types import Stock
+from ..dataloaders import ChildrenByCategoryIdLoader, ImagesByProductIdLoader
 from ..filters import AttributeFilterInput
 from ..resolvers import resolve_attributes
 from .attributes import Attribute, SelectedAttribute
 from .digital_contents import DigitalContent
 
 
+def optimize_reverse_prefetch(qs, info, related_field: str):
+    """Optimize a queryset prefetched through a reverse foreign key.
+
+    The optimizer limits the loaded columns to the selected fields, while
+    prefetching reads the foreign key of every fetched object to match it with
+    its parent. Keep that key loaded, otherwise it is fetched with one query per
+    object.
+    """
+    qs = gql_optimizer.query(qs, info)
+    loaded_fields, defer = qs.query.deferred_loading
+    if loaded_fields and not defer:
+        qs = qs.only(*loaded_fields, related_field)
+    return qs
+
+
 def prefetch_products(info, *_args, **_kwargs):
     """Prefetch products visible to the current user.
 
@@ -67,9 +83,11 @@ def prefetch_products(info, *_args, **_kwargs):
     """
     user = info.context.user
     qs = models.Product.objects.visible_to_user(user)
+    model = info.parent_type.graphene_type._meta.model
+    related_field = model._meta.get_field("products").field.name
     return Prefetch(
         "products",
-        queryset=gql_optimizer.query(qs, info),
+        queryset=optimize_reverse_prefetch(qs, info, related_field),
         to_attr="prefetched_products",
     )
 
@@ -84,6 +102,48 @@ def prefetch_products_collection_sorted(info, *_args, **_kwargs):
     )
 
 
+def prefetch_children(info, *_args, **_kwargs):
+    qs = models.Category.objects.all()
+    return Prefetch(
+        "children",
+        queryset=optimize_reverse_prefetch(qs, info, "parent"),
+        to_attr="prefetched_children",
+    )
+
+
+def get_product_thumbnail_url(context, image: models.ProductImage, size: int) -> str:
+    """Return the absolute thumbnail URL of a product image.
+
+    URLs are cached for the operation, so a product appearing several times in one
+    response has its thumbnail URL built only once.
+    """
+    cache = get_operation_cache(context, "product_thumbnail_urls")
+    key = (image.pk, size)
+    if key not in cache:
+        url = get_product_image_thumbnail(image, size, method="thumbnail")
+        cache[key] = context.build_absolute_uri(url)
+    return cache[key]
+
+
+def get_category_ancestors(
+    info, category: models.Category
+) -> Tuple[models.Category, ...]:
+    """Return the ancestors of a category.
+
+    Results are cached for the operation, as the same category is often asked for
+    its ancestors several times when resolving a category tree. Ancestors are
+    optimized for the selection of the resolved field, so the cache is keyed by
+    that field as well, and stored as a tuple, so cache hits never touch the
+    database.
+    """
+    cache = get_operation_cache(info.context, "category_ancestors")
+    key = (category.pk, info.field_asts[0])
+    if key not in cache:
+        qs = gql_optimizer.query(category.get_ancestors(), info)
+        cache[key] = tuple(qs)
+    return cache[key]
+
+
 def resolve_attribute_list(
     instance: Union[models.Product, models.ProductVariant], *, user
 ) -> List[SelectedAttribute]:
@@ -302,14 +362,16 @@ class ProductVariant(CountableDjangoObjectType, MetadataObjectType):
 
     @staticmethod
     def resolve_stock_quantity(root: models.ProductVariant, info):
-        country = info.context.country
-        try:
-            stock = stock_models.Stock.objects.get_variant_stock_for_country(
-                country, root
-            )
-        except stock_models.Stock.DoesNotExist:
-            return 0
-        return get_available_quantity_for_customer(stock)
+        def calculate_stock_quantity(stock):
+            if stock is None:
+                return 0
+            return get_available_quantity_for_customer(stock)
+
+        return (
+            StockByProductVariantIdLoader(info.context)
+            .load(root.id)
+            .then(calculate_stock_quantity)
+        )
 
     @staticmethod
     @gql_optimizer.resolver_hints(
@@ -345,7 +407,14 @@ class ProductVariant(CountableDjangoObjectType, MetadataObjectType):
             context.currency,
             extensions=context.extensions,
         )
-        return VariantPricingInfo(**asdict(availability))
+        return VariantPricingInfo(
+            on_sale=availability.on_sale,
+            discount=availability.discount,
+            discount_local_currency=availability.discount_local_currency,
+            price=availability.price,
+            price_undiscounted=availability.price_undiscounted,
+            price_local_currency=availability.price_local_currency,
+        )
 
     @staticmethod
     def resolve_is_available(root: models.ProductVariant, info):
@@ -450,11 +519,8 @@ class Product(CountableDjangoObjectType, MetadataObjectType):
         graphene.List(ProductVariant, description="List of variants for the product."),
         model_field="variants",
     )
-    images = gql_optimizer.field(
-        graphene.List(
-            lambda: ProductImage, description="List of images for the product."
-        ),
-        model_field="images",
+    images = graphene.List(
+        lambda: ProductImage, description="List of images for the product."
     )
     collections = gql_optimizer.field(
         graphene.List(
@@ -492,14 +558,20 @@ class Product(CountableDjangoObjectType, MetadataObjectType):
         return TaxType(tax_code=tax_data.code, description=tax_data.description)
 
     @staticmethod
-    @gql_optimizer.resolver_hints(prefetch_related="images")
+    @gql_optimizer.resolver_hints(only=["id"])
     def resolve_thumbnail(root: models.Product, info, *, size=255):
-        image = root.get_first_image()
-        if image:
-            url = get_product_image_thumbnail(image, size, method="thumbnail")
-            alt = image.alt
-            return Image(alt=alt, url=info.context.build_absolute_uri(url))
-        return None
+        def return_first_thumbnail(images):
+            if images:
+                image = images[0]
+                url = get_product_thumbnail_url(info.context, image, size)
+                return Image(alt=image.alt, url=url)
+            return None
+
+        return (
+            ImagesByProductIdLoader(info.context)
+            .load(root.id)
+            .then(return_first_thumbnail)
+        )
 
     @staticmethod
     def resolve_url(root: models.Product, *_args):
@@ -519,7 +591,14 @@ class Product(CountableDjangoObjectType, MetadataObjectType):
             context.currency,
             context.extensions,
         )
-        return ProductPricingInfo(**asdict(availability))
+        return ProductPricingInfo(
+            on_sale=availability.on_sale,
+            discount=availability.discount,
+            discount_local_currency=availability.discount_local_currency,
+            price_range=availability.price_range,
+            price_range_undiscounted=availability.price_range_undiscounted,
+            price_range_local_currency=availability.price_range_local_currency,
+        )
 
     @staticmethod
     @gql_optimizer.resolver_hints(prefetch_related=("variants"))
@@ -555,7 +634,8 @@ class Product(CountableDjangoObjectType, MetadataObjectType):
                 ).prefetch_related("productassignments__values", "attribute"),
                 to_attr="storefront_attributes",
             )
-        ]
+        ],
+        only=["product_type"],
     )
     def resolve_attributes(root: models.Product, info):
         return resolve_attribute_list(root, user=info.context.user)
@@ -581,9 +661,9 @@ class Product(CountableDjangoObjectType, MetadataObjectType):
             raise GraphQLError("Product image not found.")
 
     @staticmethod
-    @gql_optimizer.resolver_hints(model_field="images")
-    def resolve_images(root: models.Product, *_args, **_kwargs):
-        return root.images.all()
+    @gql_optimizer.resolver_hints(only=["id"])
+    def resolve_images(root: models.Product, info, **_kwargs):
+        return ImagesByProductIdLoader(info.context).load(root.id)
 
     @staticmethod
     def resolve_variants(root: models.Product, *_args, **_kwargs):
@@ -793,8 +873,11 @@ class Category(CountableDjangoObjectType, MetadataObjectType):
     )
     # Deprecated. To remove in #5022
     url = graphene.String(description="The storefront's URL for the category.")
-    children = PrefetchingConnectionField(
-        lambda: Category, description="List of children of the category."
+    children = gql_optimizer.field(
+        PrefetchingConnectionField(
+            lambda: Category, description="List of children of the category."
+        ),
+        prefetch_related=prefetch_children,
     )
     background_image = graphene.Field(
         Image, size=graphene.Int(description="Size of the image.")
@@ -823,8 +906,7 @@ class Category(CountableDjangoObjectType, MetadataObjectType):
 
     @staticmethod
     def resolve_ancestors(root: models.Category, info, **_kwargs):
-        qs = root.get_ancestors()
-        return gql_optimizer.query(qs, info)
+        return get_category_ancestors(info, root)
 
     @staticmethod
     def resolve_background_image(root: models.Category, info, size=None, **_kwargs):
@@ -839,6 +921,8 @@ class Category(CountableDjangoObjectType, MetadataObjectType):
 
     @staticmethod
     def resolve_children(root: models.Category, info, **_kwargs):
+        if hasattr(root, "prefetched_children"):
+            return root.prefetched_children
         qs = root.children.all()
         return gql_optimizer.query(qs, info)
 
@@ -849,17 +933,25 @@ class Category(CountableDjangoObjectType, MetadataObjectType):
 
     @staticmethod
     def resolve_products(root: models.Category, info, **_kwargs):
-        # If the category has no children, we use the prefetched data.
-        children = root.children.all()
-        if not children and hasattr(root, "prefetched_products"):
-            return root.prefetched_products
-
-        # Otherwise we want to include products from child categories which
-        # requires performing additional logic.
-        tree = root.get_descendants(include_self=True)
-        qs = models.Product.objects.published()
-        qs = qs.filter(category__in=tree)
-        return gql_optimizer.query(qs, info)
+        def _resolve_products(children):
+            # If the category has no children, we use the prefetched data.
+            if not children and hasattr(root, "prefetched_products"):
+                return root.prefetched_products
+
+            # Otherwise we want to include products from child categories which
+            # requires performing additional logic.
+            tree = root.get_descendants(include_self=True)
+            qs = models.Product.objects.published()
+            qs = qs.filter(category__in=tree)
+            return gql_optimizer.query(qs, info)
+
+        if hasattr(root, "prefetched_children"):
+            return _resolve_products(root.prefetched_children)
+        return (
+            ChildrenByCategoryIdLoader(info.context)
+            .load(root.id)
+            .then(_resolve_products)
+        )
 
     @staticmethod
     @permission_required(ProductPermissions.MANAGE_PRODUCTS)
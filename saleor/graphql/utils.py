@@ -6,10 +6,10 @@ from django.utils import timezone
 from graphene_django.registry import get_global_registry
 from graphql.error import GraphQLError
 from graphql_jwt.utils import jwt_payload
-from graphql_relay import from_global_id
 
 from .core.enums import PermissionEnum, ReportingPeriod
 from .core.types import PermissionDisplay, SortInputObjectType
+from .core.utils import decode_global_id
 
 ERROR_COULD_NO_RESOLVE_GLOBAL_ID = (
     "Could not resolve to a node with the global id list of '%s'."
@@ -19,7 +19,7 @@ registry = get_global_registry()
 
 def get_database_id(info, node_id, only_type):
     """Get a database ID from a node ID of given type."""
-    _type, _id = graphene.relay.Node.from_global_id(node_id)
+    _type, _id = decode_global_id(node_id)
     if _type != str(only_type):
         raise AssertionError("Must receive a %s id." % str(only_type))
     return _id
@@ -42,7 +42,7 @@ def _resolve_nodes(ids, graphene_type=None):
             continue
 
         try:
-            node_type, _id = from_global_id(graphql_id)
+            node_type, _id = decode_global_id(graphql_id)
         except Exception:
             invalid_ids.append(graphql_id)
             continue
@@ -185,6 +185,9 @@ class GraphQLView(View):
             # We only include it optionally since
             # executor is not a valid argument in all backends
             extra_options["executor"] = self.executor
+        # Operations sent in one batch share the request, drop data loaded and
+        # cached by the previous one
+        request.dataloaders = {}  # type: ignore
         try:
             with connection.execute_wrapper(tracing_wrapper):
                 return document.execute(  # type: ignore
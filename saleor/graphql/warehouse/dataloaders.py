@@ -0,0 +1,19 @@
+from ...warehouse.models import Stock
+from ..core.dataloaders import DataLoader
+
+
+class StockByProductVariantIdLoader(DataLoader):
+    """Load the stock of product variants in the country of the request."""
+
+    context_key = "stock_by_productvariant"
+
+    def batch_load(self, keys):
+        # Only the quantities are needed, skip the variants and warehouses joined
+        # by `for_country`
+        stocks = (
+            Stock.objects.for_country(self.context.country)
+            .filter(product_variant_id__in=keys)
+            .select_related(None)
+        )
+        stock_map = {stock.product_variant_id: stock for stock in stocks}
+        return [stock_map.get(variant_id) for variant_id in keys]
@@ -2,8 +2,10 @@ from enum import Enum
 
 
 class PaymentError(Exception):
+    __slots__ = ("message",)
+
     def __init__(self, message):
-        super(PaymentError, self).__init__(message)
+        # `Exception.__new__` already stores the message in `args`
         self.message = message
 
 
@@ -14,10 +16,10 @@ class GatewayError(IOError):
 class CustomPaymentChoices:
     MANUAL = "manual"
 
-    CHOICES = [(MANUAL, "Manual")]
+    CHOICES = ((MANUAL, "Manual"),)
 
 
-class OperationType(Enum):
+class OperationType(str, Enum):
     PROCESS_PAYMENT = "process_payment"
     AUTH = "authorize"
     CAPTURE = "capture"
@@ -26,7 +28,7 @@ class OperationType(Enum):
     CONFIRM = "confirm"
 
 
-class TransactionError(Enum):
+class TransactionError(str, Enum):
     """Represents a transaction error."""
 
     INCORRECT_NUMBER = "incorrect_number"
@@ -61,13 +63,13 @@ class TransactionKind:
     # FIXME we could use another status like WAITING_FOR_AUTH for transactions
     # Which were authorized, but needs to be confirmed manually by staff
     # eg. Braintree with "submit_for_settlement" enabled
-    CHOICES = [
+    CHOICES = (
         (AUTH, "Authorization"),
         (REFUND, "Refund"),
         (CAPTURE, "Capture"),
         (VOID, "Void"),
         (CONFIRM, "Confirm"),
-    ]
+    )
 
 
 class ChargeStatus:
@@ -89,10 +91,10 @@ class ChargeStatus:
     PARTIALLY_REFUNDED = "partially-refunded"
     FULLY_REFUNDED = "fully-refunded"
 
-    CHOICES = [
+    CHOICES = (
         (NOT_CHARGED, "Not charged"),
         (PARTIALLY_CHARGED, "Partially charged"),
         (FULLY_CHARGED, "Fully charged"),
         (PARTIALLY_REFUNDED, "Partially refunded"),
         (FULLY_REFUNDED, "Fully refunded"),
-    ]
+    )
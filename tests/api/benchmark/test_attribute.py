@@ -0,0 +1,37 @@
+import pytest
+
+from tests.api.utils import get_graphql_content
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_retrieve_attributes_with_values(
+    staff_api_client,
+    permission_manage_products,
+    color_attribute,
+    size_attribute,
+    count_queries,
+):
+    query = """
+        query {
+          attributes(first: 10) {
+            edges {
+              node {
+                id
+                name
+                values {
+                  id
+                  name
+                  inputType
+                }
+              }
+            }
+          }
+        }
+    """
+
+    get_graphql_content(
+        staff_api_client.post_graphql(
+            query, permissions=[permission_manage_products], check_no_permissions=False
+        )
+    )
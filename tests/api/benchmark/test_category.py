@@ -0,0 +1,72 @@
+import pytest
+from graphene import Node
+
+from tests.api.utils import get_graphql_content
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_categories_children_products(
+    categories_tree_with_published_products, api_client, count_queries
+):
+    query = """
+        query {
+          categories(level: 0, first: 10) {
+            edges {
+              node {
+                name
+                children(first: 10) {
+                  edges {
+                    node {
+                      name
+                      products(first: 10) {
+                        edges {
+                          node {
+                            name
+                          }
+                        }
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+    """
+
+    get_graphql_content(api_client.post_graphql(query))
+
+
+@pytest.fixture()
+def grandchild_category(categories_tree):
+    child = categories_tree.children.get()
+    return child.children.create(name="Grandchild", slug="grandchild")
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_category_aliased_ancestors(grandchild_category, api_client, count_queries):
+    query = """
+        query ($id: ID!) {
+          category(id: $id) {
+            names: ancestors(first: 20) {
+              edges {
+                node {
+                  name
+                }
+              }
+            }
+            slugs: ancestors(first: 20) {
+              edges {
+                node {
+                  slug
+                }
+              }
+            }
+          }
+        }
+    """
+
+    variables = {"id": Node.to_global_id("Category", grandchild_category.pk)}
+    get_graphql_content(api_client.post_graphql(query, variables))
@@ -178,3 +178,66 @@ def test_retrieve_product_attributes(product_list, api_client, count_queries):
 
     variables = {}
     get_graphql_content(api_client.post_graphql(query, variables))
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_retrieve_product_images_and_variants(
+    product_list, product_with_images, api_client, count_queries
+):
+    query = """
+        query {
+          products(first: 10) {
+            edges {
+              node {
+                id
+                images {
+                  id
+                  url
+                }
+                variants {
+                  id
+                  sku
+                }
+              }
+            }
+          }
+        }
+    """
+
+    get_graphql_content(api_client.post_graphql(query))
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_retrieve_product_list_pricing_on_sale(
+    collection_with_products, sale, api_client, count_queries
+):
+    query = """
+        query {
+          products(first: 10) {
+            edges {
+              node {
+                id
+                pricing {
+                  onSale
+                  discount {
+                    gross {
+                      amount
+                    }
+                  }
+                  priceRange {
+                    start {
+                      gross {
+                        amount
+                      }
+                    }
+                  }
+                }
+              }
+            }
+          }
+        }
+    """
+
+    get_graphql_content(api_client.post_graphql(query))
@@ -155,3 +155,27 @@ def test_product_variant_bulk_create(
     assert not data["bulkProductErrors"]
     assert data["count"] == 1
     assert product_variant_count + 1 == ProductVariant.objects.count()
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_retrieve_product_list_variants_stock_quantity(
+    product_list, api_client, count_queries
+):
+    query = """
+        query {
+          products(first: 10) {
+            edges {
+              node {
+                id
+                variants {
+                  id
+                  stockQuantity
+                }
+              }
+            }
+          }
+        }
+    """
+
+    get_graphql_content(api_client.post_graphql(query))
@@ -819,6 +819,46 @@ def test_create_attribute_value(
     assert name in [value["name"] for value in data["attribute"]["values"]]
 
 
+def test_create_attribute_values_in_single_operation(
+    staff_api_client, color_attribute, permission_manage_products
+):
+    query = """
+    mutation createAttributeValues($attributeId: ID!) {
+        first: attributeValueCreate(attribute: $attributeId, input: {name: "first"}) {
+            attribute {
+                values {
+                    name
+                }
+            }
+        }
+        second: attributeValueCreate(
+            attribute: $attributeId, input: {name: "second"}
+        ) {
+            attribute {
+                values {
+                    name
+                }
+            }
+        }
+    }
+    """
+    attribute_id = graphene.Node.to_global_id("Attribute", color_attribute.id)
+    variables = {"attributeId": attribute_id}
+    response = staff_api_client.post_graphql(
+        query, variables, permissions=[permission_manage_products]
+    )
+    content = get_graphql_content(response)
+    first_values = [
+        value["name"] for value in content["data"]["first"]["attribute"]["values"]
+    ]
+    second_values = [
+        value["name"] for value in content["data"]["second"]["attribute"]["values"]
+    ]
+    assert "first" in first_values
+    assert "second" not in first_values
+    assert {"first", "second"} <= set(second_values)
+
+
 def test_create_attribute_value_not_unique_name(
     staff_api_client, color_attribute, permission_manage_products
 ):
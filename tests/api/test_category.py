@@ -5,8 +5,9 @@ import graphene
 import pytest
 from django.template.defaultfilters import slugify
 from graphql_relay import to_global_id
+from prices import Money
 
-from saleor.product.models import Category
+from saleor.product.models import Category, Product
 from tests.api.utils import get_graphql_content, get_multipart_request_body
 from tests.utils import create_image, create_pdf_file_with_image_ext
 
@@ -46,6 +47,168 @@ def test_category_query(user_api_client, product):
     assert len(category_data["children"]["edges"]) == category.get_children().count()
 
 
+def test_category_query_repeated_in_request(user_api_client, categories_tree):
+    category = categories_tree
+    child = category.children.first()
+    query = """
+    fragment CategoryFields on Category {
+        name
+        children(first: 20) {
+            edges {
+                node {
+                    name
+                }
+            }
+        }
+    }
+
+    query ($id: ID!) {
+        first: category(id: $id) {
+            ...CategoryFields
+        }
+        second: category(id: $id) {
+            ...CategoryFields
+        }
+        third: category(id: $id) {
+            slug
+        }
+    }
+    """
+    variables = {"id": graphene.Node.to_global_id("Category", category.pk)}
+    response = user_api_client.post_graphql(query, variables)
+    content = get_graphql_content(response)
+    data = content["data"]
+    for alias in ["first", "second"]:
+        assert data[alias]["name"] == category.name
+        children = data[alias]["children"]["edges"]
+        assert [edge["node"]["name"] for edge in children] == [child.name]
+    assert data["third"]["slug"] == category.slug
+
+
+def test_category_query_in_batch_with_mutation(
+    staff_api_client, category, permission_manage_products
+):
+    query = """
+    query ($id: ID!) {
+        category(id: $id) {
+            name
+        }
+    }
+    """
+    mutation = """
+    mutation ($id: ID!, $name: String!) {
+        categoryUpdate(id: $id, input: {name: $name}) {
+            errors {
+                field
+                message
+            }
+        }
+    }
+    """
+    category_id = graphene.Node.to_global_id("Category", category.pk)
+    new_name = "Updated name"
+    data = [
+        {"query": query, "variables": {"id": category_id}},
+        {"query": mutation, "variables": {"id": category_id, "name": new_name}},
+        {"query": query, "variables": {"id": category_id}},
+    ]
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    response = staff_api_client.post(data)
+    content = get_graphql_content(response)
+    assert content[0]["data"]["category"]["name"] == category.name
+    assert content[1]["data"]["categoryUpdate"]["errors"] == []
+    assert content[2]["data"]["category"]["name"] == new_name
+
+
+def test_category_query_aliased_ancestors(user_api_client, categories_tree):
+    child = categories_tree.children.get()
+    grandchild = child.children.create(name="Grandchild", slug="grandchild")
+    query = """
+    query ($id: ID!) {
+        category(id: $id) {
+            names: ancestors(first: 20) {
+                edges {
+                    node {
+                        name
+                    }
+                }
+            }
+            slugs: ancestors(first: 20) {
+                edges {
+                    node {
+                        slug
+                    }
+                }
+            }
+        }
+    }
+    """
+    variables = {"id": graphene.Node.to_global_id("Category", grandchild.pk)}
+    response = user_api_client.post_graphql(query, variables)
+    content = get_graphql_content(response)
+    data = content["data"]["category"]
+    ancestors = [categories_tree, child]
+    assert [edge["node"]["name"] for edge in data["names"]["edges"]] == [
+        ancestor.name for ancestor in ancestors
+    ]
+    assert [edge["node"]["slug"] for edge in data["slugs"]["edges"]] == [
+        ancestor.slug for ancestor in ancestors
+    ]
+
+
+def test_categories_query_with_children_products(
+    user_api_client, categories_tree, product_type
+):
+    parent = Category.objects.create(name="Second parent", slug="second-parent")
+    child = parent.children.create(name="Second child", slug="second-child")
+    Product.objects.create(
+        name="Second product",
+        price=Money(10, "USD"),
+        product_type=product_type,
+        category=child,
+        is_published=True,
+    )
+    query = """
+    query {
+        categories(level: 0, first: 10) {
+            edges {
+                node {
+                    name
+                    children(first: 10) {
+                        edges {
+                            node {
+                                name
+                                products(first: 10) {
+                                    edges {
+                                        node {
+                                            name
+                                        }
+                                    }
+                                }
+                            }
+                        }
+                    }
+                }
+            }
+        }
+    }
+    """
+    response = user_api_client.post_graphql(query)
+    content = get_graphql_content(response)
+    categories = {
+        edge["node"]["name"]: edge["node"]["children"]["edges"]
+        for edge in content["data"]["categories"]["edges"]
+    }
+    for category in [categories_tree, parent]:
+        children = categories[category.name]
+        assert len(children) == 1
+        child = category.children.get()
+        products = children[0]["node"]["products"]["edges"]
+        assert [edge["node"]["name"] for edge in products] == [
+            product.name for product in child.products.all()
+        ]
+
+
 def test_category_create_mutation(
     monkeypatch, staff_api_client, permission_manage_products, media_root
 ):
@@ -12,7 +12,11 @@ from saleor.graphql.core.enums import ReportingPeriod
 from saleor.graphql.core.filters import EnumFilter
 from saleor.graphql.core.mutations import BaseMutation
 from saleor.graphql.core.types import FilterInputObjectType
-from saleor.graphql.core.utils import clean_seo_fields, snake_to_camel_case
+from saleor.graphql.core.utils import (
+    clean_seo_fields,
+    decode_global_id,
+    snake_to_camel_case,
+)
 from saleor.graphql.product import types as product_types
 from saleor.graphql.utils import get_database_id, reporting_period_to_date
 from saleor.product.models import Product
@@ -65,6 +69,12 @@ def test_get_database_id(product):
     assert int(pk) == product.pk
 
 
+def test_decode_global_id():
+    node_id = graphene.Node.to_global_id("Product", 123)
+    assert decode_global_id(node_id) == ("Product", "123")
+    assert decode_global_id(node_id) == graphene.Node.from_global_id(node_id)
+
+
 def test_snake_to_camel_case():
     assert snake_to_camel_case("test_camel_case") == "testCamelCase"
     assert snake_to_camel_case("testCamel_case") == "testCamelCase"
@@ -459,6 +459,87 @@ def test_query_product_image_by_id(user_api_client, product_with_image):
     get_graphql_content(response)
 
 
+def test_products_query_with_images_and_variants(
+    staff_api_client, product, product_with_images, permission_manage_products
+):
+    query = """
+    query {
+        products(first: 10) {
+            edges {
+                node {
+                    id
+                    images {
+                        id
+                    }
+                    variants {
+                        id
+                    }
+                }
+            }
+        }
+    }
+    """
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    response = staff_api_client.post_graphql(query)
+    content = get_graphql_content(response)
+    nodes = {
+        edge["node"]["id"]: edge["node"]
+        for edge in content["data"]["products"]["edges"]
+    }
+    for instance in [product, product_with_images]:
+        data = nodes[graphene.Node.to_global_id("Product", instance.pk)]
+        assert [image["id"] for image in data["images"]] == [
+            graphene.Node.to_global_id("ProductImage", image.pk)
+            for image in instance.images.all()
+        ]
+        assert {variant["id"] for variant in data["variants"]} == {
+            graphene.Node.to_global_id("ProductVariant", variant.pk)
+            for variant in instance.variants.all()
+        }
+
+
+def test_product_thumbnail(user_api_client, product_with_image):
+    query = """
+    query ($productId: ID!) {
+        product(id: $productId) {
+            thumbnail {
+                url
+                alt
+            }
+            thumbnail2x: thumbnail(size: 510) {
+                url
+            }
+        }
+    }
+    """
+    image = product_with_image.images.first()
+    variables = {
+        "productId": graphene.Node.to_global_id("Product", product_with_image.pk)
+    }
+    response = user_api_client.post_graphql(query, variables)
+    content = get_graphql_content(response)
+    data = content["data"]["product"]
+    assert data["thumbnail"]["alt"] == image.alt
+    assert data["thumbnail"]["url"]
+    assert data["thumbnail2x"]["url"]
+
+
+def test_product_thumbnail_without_images(user_api_client, product):
+    query = """
+    query ($productId: ID!) {
+        product(id: $productId) {
+            thumbnail {
+                url
+            }
+        }
+    }
+    """
+    variables = {"productId": graphene.Node.to_global_id("Product", product.pk)}
+    response = user_api_client.post_graphql(query, variables)
+    content = get_graphql_content(response)
+    assert content["data"]["product"]["thumbnail"] is None
+
+
 def test_product_with_collections(
     staff_api_client, product, collection, permission_manage_products
 ):
@@ -67,6 +67,36 @@ def test_fetch_variant(staff_api_client, product, permission_manage_products):
     assert len(data["stock"]) == variant.stock.count()
 
 
+def test_fetch_variant_stock_quantity(user_api_client, stock):
+    query = """
+    query ProductVariantStockQuantity($id: ID!) {
+        productVariant(id: $id) {
+            stockQuantity
+        }
+    }
+    """
+    variant = stock.product_variant
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+    response = user_api_client.post_graphql(query, {"id": variant_id})
+    content = get_graphql_content(response)
+    data = content["data"]["productVariant"]
+    assert data["stockQuantity"] == stock.quantity_available
+
+
+def test_fetch_variant_stock_quantity_without_stock(user_api_client, variant):
+    query = """
+    query ProductVariantStockQuantity($id: ID!) {
+        productVariant(id: $id) {
+            stockQuantity
+        }
+    }
+    """
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+    response = user_api_client.post_graphql(query, {"id": variant_id})
+    content = get_graphql_content(response)
+    assert content["data"]["productVariant"]["stockQuantity"] == 0
+
+
 def test_create_variant(
     staff_api_client, product, product_type, permission_manage_products
 ):
@@ -12,6 +12,7 @@ from saleor.discount.utils import (
     add_voucher_usage_by_customer,
     decrease_voucher_usage,
     get_product_discount_on_sale,
+    get_product_discounts,
     increase_voucher_usage,
     remove_voucher_usage_by_customer,
     validate_voucher,
@@ -162,6 +163,33 @@ def test_sale_applies_to_correct_products(product_type, category):
         get_product_discount_on_sale(sec_variant.product, set(), discount)
 
 
+def test_get_product_discounts_with_prefetched_collections(product, collection):
+    product.collections.add(collection)
+    product = Product.objects.prefetch_related("collections").get(pk=product.pk)
+    sale = Sale(type=DiscountValueType.FIXED, value=5)
+    discount = DiscountInfo(
+        sale=sale,
+        product_ids=set(),
+        category_ids=set(),
+        collection_ids={collection.pk},
+    )
+    discounts = list(get_product_discounts(product, [discount]))
+    assert len(discounts) == 1
+
+
+def test_get_product_discounts_without_prefetched_collections(product, collection):
+    product.collections.add(collection)
+    sale = Sale(type=DiscountValueType.FIXED, value=5)
+    discount = DiscountInfo(
+        sale=sale,
+        product_ids=set(),
+        category_ids=set(),
+        collection_ids={collection.pk},
+    )
+    discounts = list(get_product_discounts(product, [discount]))
+    assert len(discounts) == 1
+
+
 def test_increase_voucher_usage():
     voucher = Voucher.objects.create(
         code="unique",